@@ -1,4 +1,15 @@
-from .settings import config
+from . import settings
 from .io import fetch_data, load_data
 from .loaders import load_nwb, load_mat
 from .plotting import animate_1d_convolution
+
+
+def __getattr__(name):
+    # defer construction of the config singleton until it is first accessed
+    if name == "config":
+        return settings.config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), "config"})
@@ -2,7 +2,7 @@ from pathlib import Path
 import pooch
 from .registry import DATA_REGISTRY, DATA_URLS, DATA_DOWNLOADER, DATA_LOADER
 
-from .settings import config
+from . import settings
 
 
 def fetch_data(dataset, stream_data=False):
@@ -22,6 +22,7 @@ def fetch_data(dataset, stream_data=False):
 
     """
 
+    config = settings.config
     if dataset in config["unique_data_dir"].keys():
         data_dir = config["unique_data_dir"][dataset]
     else:
@@ -1,63 +1,111 @@
 import os
 import json
 import pooch
-from functools import wraps
-from os import PathLike
-from collections.abc import MutableMapping
+from functools import cache
+from pathlib import Path
 from .registry import DATA_LOADER
 
-DATA_SETS = DATA_LOADER.keys()
+# orjson is used for config file I/O when installed (the "orjson" extra), with
+# the standard library as a fallback; both write the same 2-space indented JSON
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+
+DATA_SETS = frozenset(DATA_LOADER)
 
 LOCAL_CONFIG = "pynacollada_conf.json"
 
-DEFAULT_DIR = str(pooch.os_cache("pynacollada"))
-defaults = dict(
-    {
-        "data_dir": DEFAULT_DIR,
+
+@cache
+def _default_dir():
+    # the cache directory is resolved on first use rather than at import
+    return str(pooch.os_cache("pynacollada"))
+
+
+@cache
+def _defaults():
+    return {
+        "data_dir": _default_dir(),
         "unique_data_dir": {},
     }
-)
 
 
-def _validate_conf(func):
-    @wraps(func)
-    def wrapper(self, key, value):
-        if not isinstance(key, str):
-            raise TypeError("Key must be a string")
-        match key:
-            case "data_dir":
-                if isinstance(value, PathLike):
-                    # convert path to string for serialization
-                    value = str(value)
-                if not isinstance(value, str):
-                    raise TypeError("data_dir must be a string or PathLike object")
-
-            case "unique_data_dir":
-                if not isinstance(value, dict):
-                    raise TypeError(
-                        "unique_data_dir must be a dictionary with dataset names as keys and paths as values"
-                    )
-                for k, v in value.items():
-                    if k not in DATA_SETS:
-                        raise ValueError(
-                            f"Invalid dataset name: {k}. Must be one of {DATA_SETS}"
-                        )
-                    if isinstance(v, PathLike):
-                        # convert path to string for serialization
-                        value[k] = str(v)
-                    if not isinstance(value[k], str):
-                        raise TypeError(
-                            "unique_data_dir values must be strings or PathLike objects"
-                        )
-
-        return func(self, key, value)
-
-    return wrapper
-
-
-class Config(MutableMapping):
+def __getattr__(name):
+    # resolve defaults and construct the config singleton lazily on first access (PEP 562)
+    global config
+    if name == "DEFAULT_DIR":
+        return _default_dir()
+    if name == "defaults":
+        return _defaults()
+    if name == "config":
+        config = Config()
+        return config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    # list the lazily resolved attributes so they show up in tab completion
+    return sorted({*globals(), "config", "defaults", "DEFAULT_DIR"})
+
+
+def _validate_data_dir(value):
+    try:
+        # convert path to string for serialization
+        value = os.fspath(value)
+    except TypeError:
+        raise TypeError("data_dir must be a string or PathLike object") from None
+    if isinstance(value, bytes):
+        raise TypeError("data_dir must be a string or PathLike object")
+    return value
+
+
+def _validate_unique_data_dir(value):
+    if not isinstance(value, dict):
+        raise TypeError(
+            "unique_data_dir must be a dictionary with dataset names as keys and paths as values"
+        )
+    # build a new dict rather than converting the caller's dict in place
+    out = {}
+    for k, v in value.items():
+        if k not in DATA_SETS:
+            raise ValueError(
+                f"Invalid dataset name: {k}. Must be one of {sorted(DATA_SETS)}"
+            )
+        try:
+            # convert path to string for serialization
+            out[k] = os.fspath(v)
+        except TypeError:
+            raise TypeError(
+                "unique_data_dir values must be strings or PathLike objects"
+            ) from None
+        if isinstance(out[k], bytes):
+            raise TypeError(
+                "unique_data_dir values must be strings or PathLike objects"
+            )
+    return out
+
+
+# validators for keys with constrained values, looked up once per assignment
+_VALIDATORS = {
+    "data_dir": _validate_data_dir,
+    "unique_data_dir": _validate_unique_data_dir,
+}
+
+
+class Config(dict):
     """
-    Configuration settings for pynacollada package. Can be updated and saved to a local configuration file, 'nsl_tutorials_conf.json', in the current working directory.
+    Configuration settings for pynacollada package. Can be updated and saved to a local configuration file, 'pynacollada_conf.json', in the current working directory.
 
     If a local configuration file is found in the current working directory, it will be loaded automatically when the package is imported.
 
@@ -66,7 +114,9 @@ class Config(MutableMapping):
     Attributes
     ----------
     data_dir : str
-        Path to data directory. Defaults to subdirectory 'data' if it exists in the current working directory, otherwise defaults to the current working directory.
+        Path to data directory. Defaults to the pynacollada cache directory given by `pooch.os_cache`.
+    unique_data_dir : dict
+        Per-dataset data directories, keyed by dataset name. Datasets not listed here are stored in a subdirectory of `data_dir`.
 
     Examples
     --------
@@ -98,51 +148,88 @@ class Config(MutableMapping):
     _instance = None
 
     # override __new__ to enforce a single instance of Config
-    def __new__(cls, conf_file=LOCAL_CONFIG, defaults=defaults):
+    def __new__(cls, conf_file=LOCAL_CONFIG, defaults=None):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance.update(defaults)
-
-            if os.path.exists(conf_file):
-                import json
-
-                with open(conf_file, "r") as f:
-                    conf = json.load(f)
-
-                cls._instance.update(conf)
+            instance = super().__new__(cls)
+
+            if defaults is None:
+                # the in-code defaults are set without validation; unique_data_dir is
+                # copied so that edits to the config do not leak back into the defaults
+                defaults = _defaults()
+                super(Config, instance).update(
+                    defaults, unique_data_dir=dict(defaults["unique_data_dir"])
+                )
+            else:
+                instance.update(defaults)
+
+            # the local config file may be edited by hand, so it is validated
+            try:
+                conf = _loads(Path(conf_file).read_bytes())
+            except FileNotFoundError:
+                pass
+            else:
+                instance.update(conf)
+
+            cls._instance = instance
 
         return cls._instance
 
-    # def __init__(self, conf_file=LOCAL_CONFIG, defaults=defaults):
-    #     super().__init__()
-    #     self.update(defaults)
-
-    #     if os.path.exists(conf_file):
-    #         import json
+    @classmethod
+    def instance(cls):
+        """
+        Return the configuration singleton, constructing it on first call.
 
-    #         with open(conf_file, "r") as f:
-    #             conf = json.load(f)
+        Examples
+        --------
+        >>> import pynacollada as nac
+        >>> nac.settings.Config.instance() is nac.config
+        True
+        """
+        if cls._instance is None:
+            return cls()
+        return cls._instance
 
-    #         self.update(conf)
+    def __init__(self, *args, **kwargs):
+        # settings are populated once in __new__; skip dict.__init__ so that
+        # calling Config() again does not overwrite the singleton
+        pass
 
-    @_validate_conf
     def __setitem__(self, key, value):
-        self.__dict__[key] = value
-
-    def __getitem__(self, key):
-        return self.__dict__[key]
-
-    def __delitem__(self, key):
-        del self.__dict__[key]
-
-    def __iter__(self):
-        return iter(self.__dict__)
-
-    def __len__(self):
-        return len(self.__dict__)
-
-    def __repr__(self):
-        return self.__dict__.__repr__()
+        if not isinstance(key, str):
+            raise TypeError("Key must be a string")
+        validator = _VALIDATORS.get(key)
+        if validator:
+            value = validator(value)
+        super().__setitem__(key, value)
+
+    def __getattr__(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+    def __setattr__(self, key, value):
+        self[key] = value
+
+    def __delattr__(self, key):
+        try:
+            del self[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+    def update(self, *args, **kwargs):
+        # dict.update does not call __setitem__, so route each key through it for validation
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
 
     def save(self, conf_file=LOCAL_CONFIG):
         """
@@ -151,20 +238,19 @@ class Config(MutableMapping):
         Parameters
         ----------
         conf_file : str, optional
-            Path to save configuration file. Defaults to 'nsl_tutorials_conf.json' in the current working directory.
+            Path to save configuration file. Defaults to 'pynacollada_conf.json' in the current working directory.
 
         Examples
         --------
         Save current configuration settings in the current working directory:
-        >>> import neurotutorials as nt
-        >>> nt.config["data_dir"] = "/new/path/to/data"
-        >>> nt.config.save()
+        >>> import pynacollada as nac
+        >>> nac.config["data_dir"] = "/new/path/to/data"
+        >>> nac.config.save()
 
         Save configuration settings to a different location:
-        >>> nt.config.save("/path/to/config.json")
+        >>> nac.config.save("/path/to/config.json")
         """
-        with open(conf_file, "w") as f:
-            json.dump(self.__dict__, f, indent=4)
+        Path(conf_file).write_bytes(_dumps(self))
 
     def load(self, conf_file=LOCAL_CONFIG):
         """
@@ -173,23 +259,19 @@ class Config(MutableMapping):
         Parameters
         ----------
         conf_file : str, optional
-            Path to configuration file. Defaults to 'nsl_tutorials_conf.json' in the current working directory.
+            Path to configuration file. Defaults to 'pynacollada_conf.json' in the current working directory.
 
         Examples
         --------
         Load configuration settings from a different location:
-        >>> import neurotutorials as nt
-        >>> nt.config.load("/path/to/config.json")
+        >>> import pynacollada as nac
+        >>> nac.config.load("/path/to/config.json")
         """
-        with open(conf_file, "r") as f:
-            self.update(json.load(f))
+        self.update(_loads(Path(conf_file).read_bytes()))
 
     def reset(self):
         """
         Reset configuration settings to defaults.
         """
-        del self.__dict__
-        self.update(defaults)
-
-
-config = Config()
+        self.clear()
+        self.update(_defaults())
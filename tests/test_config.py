@@ -1,10 +1,29 @@
 import pynacollada as nac
 from pathlib import Path
 import copy
+import json
 import pytest
+import subprocess
+import sys
 from contextlib import nullcontext as does_not_raise
 
 
+def test_config_lazy_import():
+    # run in a fresh interpreter, since this session has already built the config
+    code = (
+        "import pynacollada as nac; "
+        "assert nac.settings.Config._instance is None; "
+        "assert nac.settings._default_dir.cache_info().currsize == 0"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_config_dir():
+    assert "config" in dir(nac)
+    for name in ["config", "defaults", "DEFAULT_DIR"]:
+        assert name in dir(nac.settings)
+
+
 def test_config_defaults():
     defaults = nac.settings.defaults
 
@@ -26,6 +45,8 @@ def test_config_reset():
         assert nac.config[key] == value
 
     assert "user" not in nac.config.keys()
+    assert nac.config["unique_data_dir"] == {}
+    assert nac.settings.defaults["unique_data_dir"] == {}
 
 
 def test_config_instance():
@@ -33,6 +54,72 @@ def test_config_instance():
     nac.config["data_dir"] = "/path/to/data"
     assert nac.settings.Config() == nac.config
     assert id(nac.settings.Config()) == id(nac.config)
+    assert nac.settings.Config.instance() is nac.config
+
+
+@pytest.mark.parametrize(
+    "conf, expected",
+    [
+        ({"data_dir": "/path/to/data"}, does_not_raise()),
+        ({"data_dir": 5}, pytest.raises(TypeError)),
+        (
+            {"unique_data_dir": {"bogus": "/path/to/data"}},
+            pytest.raises(ValueError, match="Invalid dataset name"),
+        ),
+    ],
+)
+def test_config_file_validated(conf, expected, tmp_path, monkeypatch):
+    conf_file = tmp_path / "conf.json"
+    conf_file.write_text(json.dumps(conf))
+    monkeypatch.setattr(nac.settings.Config, "_instance", None)
+
+    with expected as e:
+        config = nac.settings.Config(conf_file)
+
+    if not e:
+        assert config["data_dir"] == conf["data_dir"]
+        assert config["unique_data_dir"] == {}
+    else:
+        assert nac.settings.Config._instance is None
+
+
+@pytest.mark.parametrize(
+    "defaults, expected",
+    [
+        ({"data_dir": "/path/to/data"}, does_not_raise()),
+        (
+            {
+                "data_dir": Path("test"),
+                "unique_data_dir": {"perceptual_straightening": Path("test")},
+            },
+            does_not_raise(),
+        ),
+        ({"data_dir": 5}, pytest.raises(TypeError)),
+        (
+            {"unique_data_dir": {"bogus": "/path/to/data"}},
+            pytest.raises(ValueError, match="Invalid dataset name"),
+        ),
+    ],
+)
+def test_config_custom_defaults(defaults, expected, tmp_path, monkeypatch):
+    monkeypatch.setattr(nac.settings.Config, "_instance", None)
+
+    with expected as e:
+        config = nac.settings.Config(tmp_path / "missing.json", defaults=defaults)
+
+    if not e:
+        for key, value in defaults.items():
+            if isinstance(value, dict):
+                for k, v in value.items():
+                    assert config[key][k] == str(v)
+            else:
+                assert config[key] == str(value)
+
+        conf_file = tmp_path / "conf.json"
+        config.save(conf_file)
+        assert json.loads(conf_file.read_text()) == dict(config)
+    else:
+        assert nac.settings.Config._instance is None
 
 
 @pytest.fixture
@@ -49,6 +136,7 @@ class Test_Config:
             ("data_dir", Path("test"), does_not_raise()),
             ("data_dir", {}, pytest.raises(TypeError)),
             ("data_dir", 123, pytest.raises(TypeError)),
+            ("data_dir", b"/path", pytest.raises(TypeError)),
             (
                 "unique_data_dir",
                 {"perceptual_straightening": "/path/to/data"},
@@ -69,6 +157,11 @@ class Test_Config:
                 {"perceptual_straightening": 123},
                 pytest.raises(TypeError),
             ),
+            (
+                "unique_data_dir",
+                {"perceptual_straightening": b"/path"},
+                pytest.raises(TypeError),
+            ),
             (
                 "unique_data_dir",
                 "test",
@@ -180,6 +273,69 @@ class Test_Config:
         assert nac.config["data_dir"] == "/other/path/to/data"
         assert nac.config["unique_data_dir"] == {}
 
+    def test_config_attribute_access(self):
+        nac.config.data_dir = Path("test")
+        assert nac.config.data_dir == "test"
+        assert nac.config["data_dir"] == "test"
+
+        with pytest.raises(TypeError):
+            nac.config.data_dir = 123
+
+        nac.config.user = "test_user"
+        del nac.config.user
+        assert "user" not in nac.config
+
+        with pytest.raises(AttributeError):
+            nac.config.user
+
+    def test_config_setdefault(self):
+        assert nac.config.setdefault("data_dir", "/path/to/data") != "/path/to/data"
+
+        del nac.config["data_dir"]
+        assert nac.config.setdefault("data_dir", Path("test")) == "test"
+
+        del nac.config["data_dir"]
+        with pytest.raises(TypeError):
+            nac.config.setdefault("data_dir", 123)
+
+    def test_config_ior(self):
+        config = nac.config
+        config |= {"data_dir": Path("test")}
+        assert config is nac.config
+        assert nac.config["data_dir"] == "test"
+
+        with pytest.raises(TypeError):
+            config |= {"data_dir": 123}
+
+        with pytest.raises(ValueError, match="Invalid dataset name"):
+            config |= {"unique_data_dir": {"test": "test"}}
+
+    def test_config_singleton_not_reset(self):
+        nac.config["data_dir"] = "/path/to/data"
+        nac.settings.Config()
+        nac.settings.Config("other_conf.json")
+        assert nac.config["data_dir"] == "/path/to/data"
+
+    def test_config_unique_data_dir_not_mutated(self):
+        value = {"perceptual_straightening": Path("test")}
+        nac.config["unique_data_dir"] = value
+
+        assert nac.config["unique_data_dir"]["perceptual_straightening"] == "test"
+        assert value["perceptual_straightening"] == Path("test")
+        assert nac.config["unique_data_dir"] is not value
+
+    def test_config_dumps_format(self):
+        conf = {"data_dir": "/path/to/données", "unique_data_dir": {}}
+        assert (
+            nac.settings._dumps(conf)
+            == json.dumps(conf, indent=2, ensure_ascii=False).encode()
+        )
+        assert nac.settings._loads(nac.settings._dumps(conf)) == conf
+
+    def test_config_uses_orjson(self):
+        orjson = pytest.importorskip("orjson")
+        assert nac.settings._loads is orjson.loads
+
     # @pytest.mark.parameterize("path", [nac.settings.LOCAL_CONFIG, "test_conf.json"])
     def test_config_save_and_load(self):
         # store defaults
@@ -211,10 +367,8 @@ class Test_Config:
 
         # assert that the loaded config is different from the original
         assert nac.config["data_dir"] != config_old["data_dir"]
-        assert (
-            nac.config["unique_data_dir"]["perceptual_straightening"]
-            != config_old["unique_data_dir"]["perceptual_straightening"]
-        )
+        old_path = config_old["unique_data_dir"].get("perceptual_straightening")
+        assert nac.config["unique_data_dir"]["perceptual_straightening"] != old_path
         assert "user" not in config_old.keys()
 
         # save a second new config at a custom path